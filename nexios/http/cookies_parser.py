@@ -16,18 +16,21 @@ def parse_cookies(cookie_string: str) -> typing.Dict[str, str]:
     cookie_dict: typing.Dict[str, str] = {}
 
     for chunk in cookie_string.split(";"):
-        chunk = chunk.strip() 
-        if "=" in chunk:
-            key, val = chunk.split("=", 1)
-        else:
-            
+        key, sep, val = chunk.partition("=")
+        if not sep:
             key, val = "", chunk
 
         key = key.strip()
         val = val.strip()
 
-        if key or val: 
-           
-            cookie_dict[key] = unquote(val) if val else None  
+        if key or val:
+            if not val:
+                cookie_dict[key] = None
+            elif "%" in val:
+                # Percent-decoding dispatches to C; skip it when the value
+                # contains no escapes, which is the common case.
+                cookie_dict[key] = unquote(val)
+            else:
+                cookie_dict[key] = val
 
     return cookie_dict
@@ -3,18 +3,25 @@ from __future__ import annotations
 import json
 import typing
 from http import cookies as http_cookies
+from types import MappingProxyType
+from urllib.parse import parse_qsl
 
 import anyio
 
 from nexios.utils.async_helpers import AwaitableOrContextManager, AwaitableOrContextManagerWrapper
 from nexios.structs import URL, Address, FormData, Headers, QueryParams, State
 
-from .formparsers import FormParser, MultiPartException, MultiPartParser
+from .formparsers import MultiPartException, MultiPartParser
 try:
     from multipart.multipart import parse_options_header
 
 except ImportError:
     parse_options_header =  None
+try:
+    import orjson
+
+except ImportError:
+    orjson = None
 SERVER_PUSH_HEADERS_TO_COPY = {
     "accept",
     "accept-encoding",
@@ -38,19 +45,52 @@ def cookie_parser(cookie_string: str) -> dict[str, str]:
     """
     cookie_dict: dict[str, str] = {}
     for chunk in cookie_string.split(";"):
-        if "=" in chunk:
-            key, val = chunk.split("=", 1)
-        else:
+        key, sep, val = chunk.partition("=")
+        if not sep:
             # Assume an empty name per
             # https://bugzilla.mozilla.org/show_bug.cgi?id=169091
             key, val = "", chunk
         key, val = key.strip(), val.strip()
         if key or val:
-            # unquote using Python's algorithm.
-            cookie_dict[key] = http_cookies._unquote(val)
+            # unquote using Python's algorithm, skipped entirely for the
+            # overwhelmingly common unquoted value.
+            cookie_dict[key] = http_cookies._unquote(val) if val[:1] == '"' else val
     return cookie_dict
 
 
+# Shared empty mapping so the no-parameter case allocates nothing per request.
+_EMPTY_PARAMS: typing.Mapping[str, str] = MappingProxyType({})
+
+# Pre-lowercased header names, so single-header lookups compare raw bytes
+# without encoding the key on every access.
+_COOKIE_HEADER = b"cookie"
+_CONTENT_TYPE_HEADER = b"content-type"
+_USER_AGENT_HEADER = b"user-agent"
+_ORIGIN_HEADER = b"origin"
+
+
+def _parse_content_type(header: str) -> tuple[str, typing.Mapping[str, str]]:
+    """
+    Splits a ``Content-Type`` header into ``(media_type, params)``.
+
+    Headers like ``application/json`` carry no parameters, which is by far
+    the common case, so it is handled with a single partition and a shared
+    empty mapping; the params dict is only built when parameters exist
+    (e.g. ``multipart/form-data; boundary=...``).
+    """
+    media_type, sep, rest = header.partition(";")
+    media_type = media_type.strip().lower()
+    if not sep:
+        return media_type, _EMPTY_PARAMS
+    params: dict[str, str] = {}
+    for item in rest.split(";"):
+        key, _, value = item.partition("=")
+        key = key.strip().lower()
+        if key:
+            params[key] = value.strip().strip('"')
+    return media_type, params
+
+
 class ClientDisconnect(Exception):
     pass
 
@@ -113,6 +153,19 @@ class HTTPConnection(typing.Mapping[str, typing.Any]):
             self._headers = Headers(scope=self.scope)
         return self._headers
 
+    def _find_header(self, name: bytes) -> typing.Optional[bytes]:
+        """
+        Scans the raw ASGI header list for a single pre-lowercased name.
+
+        Callers that only need one header (cookies, content type, user agent)
+        get a tight compare-only loop over the existing ``(bytes, bytes)``
+        tuples instead of materializing the full ``Headers`` mapping.
+        """
+        for header_name, header_value in self.scope["headers"]:
+            if header_name == name:
+                return header_value
+        return None
+
     @property
     def query_params(self) -> QueryParams:
         if not hasattr(self, "_query_params"):  # pragma: no branch
@@ -127,10 +180,10 @@ class HTTPConnection(typing.Mapping[str, typing.Any]):
     def cookies(self) -> dict[str, str]:
         if not hasattr(self, "_cookies"):
             cookies: dict[str, str] = {}
-            cookie_header = self.headers.get("cookie")
+            cookie_header = self._find_header(_COOKIE_HEADER)
 
             if cookie_header:
-                cookies = cookie_parser(cookie_header)
+                cookies = cookie_parser(cookie_header.decode("latin-1"))
             self._cookies = cookies
         return self._cookies
 
@@ -169,12 +222,35 @@ class HTTPConnection(typing.Mapping[str, typing.Any]):
     
     @property
     def origin(self):
-        return self.headers.get("origin")
-    
+        origin = self._find_header(_ORIGIN_HEADER)
+        if origin is None:
+            return None
+        return origin.decode("latin-1")
+
+    @property
+    def content_type(self) -> str:
+        """Returns the lowercased media type from the Content-Type header, parsed only once."""
+        if not hasattr(self, "_content_type"):
+            header = self._find_header(_CONTENT_TYPE_HEADER)
+            self._content_type, self._content_type_params = _parse_content_type(
+                header.decode("latin-1") if header else ""
+            )
+        return self._content_type
+
+    @property
+    def content_type_params(self) -> typing.Mapping[str, str]:
+        """Returns the Content-Type header parameters (e.g. charset, boundary)."""
+        if not hasattr(self, "_content_type_params"):
+            self.content_type
+        return self._content_type_params
+
     @property
     def user_agent(self) -> str:
-        """Returns the User-Agent header if available."""
-        return self.headers.get("user-agent", "")
+        """Returns the User-Agent header if available, decoded only once."""
+        if not hasattr(self, "_user_agent"):
+            user_agent = self._find_header(_USER_AGENT_HEADER)
+            self._user_agent = user_agent.decode("latin-1") if user_agent else ""
+        return self._user_agent
     
     def build_absolute_uri(self, path: str = "", query_params: dict[str, str] | None = None) -> str:
         """
@@ -208,13 +284,44 @@ async def empty_send(message) -> typing.NoReturn:
     raise RuntimeError("Send channel has not been made available")
 
 
+class _BufferedReceive:
+    """
+    Wraps an ASGI ``receive`` callable with a one-slot pushback buffer.
+
+    ``is_disconnected`` needs to poll for an ``http.disconnect`` without
+    consuming a body message that ``stream()``/``body()`` still expects, so
+    ``peek`` reads ahead into the buffer and a latch records any disconnect
+    seen on the wire.
+    """
+
+    def __init__(self, receive) -> None:
+        self._receive = receive
+        self._buffered = None
+        self.disconnected = False
+
+    async def __call__(self):
+        if self._buffered is not None:
+            message, self._buffered = self._buffered, None
+            return message
+        message = await self._receive()
+        if message.get("type") == "http.disconnect":
+            self.disconnected = True
+        return message
+
+    async def peek(self):
+        """Reads the next message into the buffer without consuming it."""
+        if self._buffered is None:
+            self._buffered = await self.__call__()
+        return self._buffered
+
+
 class Request(HTTPConnection):
     _form: FormData | None
 
     def __init__(self, scope, receive = empty_receive, send = empty_send):
         super().__init__(scope)
         assert scope["type"] == "http"
-        self._receive = receive
+        self._receive = _BufferedReceive(receive)
         self._send = send
         self._stream_consumed = False
         self._is_disconnected = False
@@ -250,44 +357,67 @@ class Request(HTTPConnection):
 
     async def body(self) -> bytes:
         if not hasattr(self, "_body"):
-            chunks: list[bytes] = []
+            buffer = bytearray()
             async for chunk in self.stream():
-                chunks.append(chunk)
-            self._body = b"".join(chunks)
+                buffer.extend(chunk)
+            self._body = bytes(buffer)
         return self._body
 
     @property
     async def json(self) -> typing.Any:
-        if not hasattr(self, "_json"):  
+        if not hasattr(self, "_json"):
             body = await self.body()
-            try:
-                self._json = json.loads(body.decode())
-            except json.JSONDecodeError:
+            if not body:
                 self._json = {}
+            elif orjson is not None:
+                # orjson parses the raw bytes directly, skipping the
+                # intermediate str allocation of body.decode().
+                try:
+                    self._json = orjson.loads(body)
+                except orjson.JSONDecodeError:
+                    self._json = {}
+            else:
+                try:
+                    self._json = json.loads(body)
+                except json.JSONDecodeError:
+                    self._json = {}
         return self._json
 
+    async def _parse_multipart_form(
+        self, max_files: int | float, max_fields: int | float
+    ) -> FormData | None:
+        assert (
+            parse_options_header is not None
+        ), "The `python-multipart` library must be installed to use form parsing."
+        try:
+            multipart_parser = MultiPartParser(
+                self.headers,
+                self.stream(),
+                max_files=max_files,
+                max_fields=max_fields,
+            )
+            return await multipart_parser.parse()
+        except MultiPartException:
+            return None
+
+    async def _parse_urlencoded_form(
+        self, max_files: int | float, max_fields: int | float
+    ) -> FormData:
+        body = await self.body()
+        # parse_qsl splits and percent-decodes in a single pass; the
+        # latin-1 view of the (ASCII) body is effectively free and
+        # UTF-8 decoding happens per value inside unquote, instead of
+        # running the chunked form parser state machine over the body.
+        return FormData(parse_qsl(body.decode("latin-1"), keep_blank_values=True))
+
     async def _get_form(self, *, max_files: int | float = 1000, max_fields: int | float = 1000) -> FormData:
         if self._form is None:
-            assert (
-                parse_options_header is not None
-            ), "The `python-multipart` library must be installed to use form parsing."
-            content_type_header = self.headers.get("Content-Type")
-            content_type: bytes
-            content_type, _ = parse_options_header(content_type_header)
-            if content_type == b"multipart/form-data":
-                try:
-                    multipart_parser = MultiPartParser(
-                        self.headers,
-                        self.stream(),
-                        max_files=max_files,
-                        max_fields=max_fields,
-                    )
-                    self._form = await multipart_parser.parse()
-                except MultiPartException as exc:
-                    self._form = None
-            elif content_type == b"application/x-www-form-urlencoded":
-                form_parser = FormParser(self.headers, self.stream())
-                self._form = await form_parser.parse()
+            # content_type is already parsed, cached and lowercased, so
+            # dispatch is a single dict lookup instead of an if/elif chain
+            # over freshly parsed header bytes.
+            handler = _FORM_HANDLERS.get(self.content_type)
+            if handler is not None:
+                self._form = await handler(self, max_files, max_fields)
             else:
                 self._form = FormData()
         return self._form
@@ -303,15 +433,14 @@ class Request(HTTPConnection):
 
     async def is_disconnected(self) -> bool:
         if not self._is_disconnected:
-            message = {}
-
-            # If message isn't immediately available, move on
+            # If a message isn't immediately available, move on. Peeking
+            # leaves any buffered body message for stream() to consume, so
+            # polling here no longer corrupts subsequent body reads.
             with anyio.CancelScope() as cs:
                 cs.cancel()
-                message = await self._receive()
+                await self._receive.peek()
 
-            if message.get("type") == "http.disconnect":
-                self._is_disconnected = True
+            self._is_disconnected = self._receive.disconnected
 
         return self._is_disconnected
 
@@ -327,4 +456,12 @@ class Request(HTTPConnection):
     @property
     def session(self):
         assert "session" in self.scope, "Session middleware not installed"
-        return self.scope['session']
\ No newline at end of file
+        return self.scope['session']
+
+
+# Media type -> form parsing handler, keyed by the cached lowercase
+# content_type so dispatch needs no per-request string comparisons.
+_FORM_HANDLERS = {
+    "multipart/form-data": Request._parse_multipart_form,
+    "application/x-www-form-urlencoded": Request._parse_urlencoded_form,
+}
\ No newline at end of file
@@ -1,6 +1,41 @@
 import typing
+from collections import deque
 from nexios.config.settings import BaseConfig
-from datetime import datetime
+from datetime import datetime, timedelta
+
+# Shared default so the common no-custom-expiry case never rebuilds a delta.
+_DEFAULT_EXPIRATION_DELTA = timedelta(seconds=86400)
+
+
+class SessionManagerPool:
+    """Recycles session manager instances instead of building one per request.
+
+    Constructing a manager on every request is allocation-heavy on the hot
+    path (instance dict, signer, storage paths). The middleware acquires an
+    idle instance, rebinds it to the incoming request via ``_reset`` and
+    releases it back once the response cookie has been written.
+    """
+
+    def __init__(self, max_size: int = 128):
+        self.max_size = max_size
+        self._idle: typing.Dict[type, deque] = {}
+
+    def acquire(self, manager_class: type, session_key: str, config: BaseConfig):
+        """Return a pooled manager reset for this request, or a fresh one."""
+        idle = self._idle.setdefault(manager_class, deque())
+        if idle:
+            manager = idle.pop()
+            manager._reset(session_key, config)
+            return manager
+        return manager_class(session_key=session_key, config=config)
+
+    def release(self, manager: "BaseSessionInterface"):
+        """Return a manager to the pool once its request has completed."""
+        idle = self._idle.setdefault(type(manager), deque())
+        if len(idle) < self.max_size:
+            idle.append(manager)
+
+
 class BaseSessionInterface:
 
     modified = False
@@ -9,19 +44,38 @@ class BaseSessionInterface:
 
     deleted = False
 
-    _session_cache = {} 
-
 
     def __init__(self,
                  session_key :str,
                  config :BaseConfig = BaseConfig) -> None:
         
 
-        self.session_key = session_key 
+        self.session_key = session_key
         assert config.SECRET_KEY != None, "Secret key is required to use session"
         self.config = config
-
-
+        self._session_cache = {}
+        self._loaded = False
+        self._expiration_delta = self._compute_expiration_delta(config)
+
+
+    def _compute_expiration_delta(self, config: BaseConfig) -> timedelta:
+        """Resolve the session expiration delta from the config once."""
+        expiration = config.SESSION_EXPIRATION_TIME
+        if isinstance(expiration, (int, float)):
+            expiration = timedelta(seconds=expiration)
+        return expiration or _DEFAULT_EXPIRATION_DELTA
+
+    def _reset(self, session_key: str, config: BaseConfig):
+        """Rebind a pooled instance to a new request, clearing per-request state."""
+        if config is not self.config:
+            self._expiration_delta = self._compute_expiration_delta(config)
+        self.session_key = session_key
+        self.config = config
+        self._session_cache = {}
+        self._loaded = False
+        self.modified = False
+        self.accessed = False
+        self.deleted = False
 
 
     def set_session(self,key :str,value :str):
@@ -39,15 +93,18 @@ class BaseSessionInterface:
     def get_all(self):
         self.accessed = True
         return self._session_cache.items()
-    
+
     def keys(self):
         return self._session_cache.keys()
-    
+
     def values(self):
+        return self._session_cache.values()
+
+    def items(self):
         return self._session_cache.items()
-    
+
     def is_empty(self):
-        return self._session_cache.items().__len__() == 0
+        return not self._session_cache
     
 
     async def save(self):
@@ -85,7 +142,7 @@ class BaseSessionInterface:
     def get_expiration_time(self) -> datetime | None:
         """Returns the expiration time for the session. Uses `config.SESSION_EXPIRATION_TIME`."""
         if self.config.SESSION_PERMANENT:
-            return datetime.utcnow() + self.config.SESSION_EXPIRATION_TIME or 86400
+            return datetime.utcnow() + self._expiration_delta
         return None
 
     @property
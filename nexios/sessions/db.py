@@ -1,37 +1,114 @@
-import uuid
+import asyncio
 from typing import Optional, Dict, Any
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from tortoise import transactions
 from .db_models import Session
 from nexios.config.settings import BaseConfig
 from .base import BaseSessionInterface
+from .utils import generate_session_key
+
+DEFAULT_WRITE_BATCH_SIZE = 100
+
+
+class _PendingSessionWriter:
+    """Coalesces session saves into one bulk database write per flush.
+
+    Pending writes are pushed onto an ``asyncio.Queue`` drained by a
+    background task, so concurrent requests share a single upsert round-trip
+    instead of each issuing their own. Callers still await their write: every
+    queued item carries a future that is resolved once its batch is flushed.
+    """
+
+    def __init__(self, batch_size: int = DEFAULT_WRITE_BATCH_SIZE):
+        self.batch_size = batch_size
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def write(self, session_key: str, data: Dict[str, Any]):
+        """Queue a session write and wait for it to be flushed."""
+        loop = asyncio.get_running_loop()
+        if self._queue is None or self._loop is not loop:
+            self._queue = asyncio.Queue()
+            self._loop = loop
+            self._task = loop.create_task(self._drain())
+        future = loop.create_future()
+        self._queue.put_nowait((session_key, dict(data), future))
+        await future
+
+    async def _drain(self):
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            await self._flush(batch)
+
+    async def _flush(self, batch):
+        sessions = [Session(id=key, data=data) for key, data, _ in batch]
+        try:
+            async with transactions.in_transaction():
+                await Session.bulk_create(
+                    sessions,
+                    update_fields=["data", "updated_at"],
+                    on_conflict=["id"],
+                )
+        except Exception as exc:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+        else:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_result(None)
+
+
+_pending_writer = _PendingSessionWriter()
 
 
 class DBSessionManager(BaseSessionInterface):
     def __init__(self, session_key: str, config: BaseConfig = BaseConfig):
-        session_key = session_key or str(uuid.uuid4())
+        session_key = session_key or generate_session_key()
         super().__init__(session_key, config)
         self.session_key = session_key
 
+    def _reset(self, session_key: str, config: BaseConfig):
+        """Rebind a pooled instance to a new request."""
+        super()._reset(session_key or generate_session_key(), config)
+
     async def _load_session_data(self) -> Optional[Dict[str, Any]]:
-        """Load session data from the database."""
-        session = await Session.get_or_none(id=self.session_key)
-        if session:
-            return session.data
-        return None
+        """Load unexpired session data from the database.
+
+        Uses ``filter(...).first()`` so a miss returns None instead of going
+        through exception control flow, and expired rows are excluded in the
+        query itself rather than loaded and checked in Python.
+        """
+        max_age = self.config.COOKIE_AGE or 259200
+        cutoff = datetime.now(timezone.utc) - timedelta(seconds=max_age)
+        session = await Session.filter(
+            id=self.session_key, updated_at__gt=cutoff
+        ).first()
+        if session is None:
+            return None
+        return session.data
 
     async def _save_session_data(self):
-        """Save the session data to the database."""
-        session_data = self._session_cache
-        session, created = await Session.get_or_create(id=self.session_key)
-        session.data = session_data
-        await session.save()
+        """Queue the session data for the next batched database flush."""
+        _pending_writer.batch_size = (
+            self.config.SESSION_WRITE_BATCH_SIZE or DEFAULT_WRITE_BATCH_SIZE
+        )
+        await _pending_writer.write(self.session_key, self._session_cache)
 
     async def set_session(self, key: str, value: str):
-        """Set a session value."""
+        """Set a session value in the per-request cache.
+
+        The write is persisted once by ``save()`` when the response goes out,
+        instead of issuing a database round-trip per modification.
+        """
         self.modified = True
         self._session_cache[key] = value
-        # Save immediately after modifying session data
-        await self._save_session_data()
 
     async def get_session(self, key: str) -> Optional[str]:
         """Get a session value."""
@@ -47,11 +124,15 @@ class DBSessionManager(BaseSessionInterface):
 
     def values(self):
         """Get all session values."""
+        return self._session_cache.values()
+
+    def items(self):
+        """Get all session items."""
         return self._session_cache.items()
 
     def is_empty(self) -> bool:
         """Check if the session is empty."""
-        return len(self._session_cache.items()) == 0
+        return not self._session_cache
 
     async def save(self):
         """Save the session data to the database."""
@@ -72,19 +153,29 @@ class DBSessionManager(BaseSessionInterface):
         return False
 
     async def load(self):
-        """Load the session data from the database."""
+        """Load the session data from the database, querying at most once per request."""
+        if self._loaded:
+            return
         session_data = await self._load_session_data()
         if session_data:
             self._session_cache.update(session_data)
         else:
             self._session_cache = {}
+        self._loaded = True
 
     async def clear(self):
         """Clear the session data."""
         self._session_cache.clear()
+        self._loaded = True
         # Delete the session record from the database
         await Session.filter(id=self.session_key).delete()
 
     def get_session_key(self) -> str:
         """Returns the session key."""
         return self.session_key
+
+    @classmethod
+    async def clear_expired(cls, max_age: int = 259200):
+        """Delete sessions whose last update is older than ``max_age`` seconds."""
+        cutoff = datetime.now(timezone.utc) - timedelta(seconds=max_age)
+        await Session.filter(updated_at__lt=cutoff).delete()
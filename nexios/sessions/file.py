@@ -1,20 +1,29 @@
-import os,uuid
+import os
 import json
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
 from nexios.config.settings import BaseConfig
 from .base import BaseSessionInterface
+from .utils import generate_session_key
+from nexios.utils.cuncurrency import run_in_threadpool
 
 
 class FileSessionManager(BaseSessionInterface):
     def __init__(self, session_key: str, config: BaseConfig = BaseConfig):
-        session_key = session_key or uuid.uuid4()
+        session_key = session_key or generate_session_key()
         super().__init__(session_key, config)
         self.session_file_path = os.path.join(self.config.SESSION_FILE_STORAGE_PATH or "sessions", f"{session_key}.json")
         
         # Ensure the session storage directory exists
         os.makedirs(self.config.SESSION_FILE_STORAGE_PATH or "sessions", exist_ok=True)
 
+    def _reset(self, session_key: str, config: BaseConfig):
+        """Rebind a pooled instance to a new request."""
+        super()._reset(session_key or generate_session_key(), config)
+        storage_path = self.config.SESSION_FILE_STORAGE_PATH or "sessions"
+        self.session_file_path = os.path.join(storage_path, f"{self.session_key}.json")
+        os.makedirs(storage_path, exist_ok=True)
+
     def _load_session_data(self) -> Optional[Dict[str, Any]]:
         """Load session data from the file."""
         if os.path.exists(self.session_file_path):
@@ -32,10 +41,13 @@ class FileSessionManager(BaseSessionInterface):
             json.dump(self._session_cache, file)
 
     def set_session(self, key: str, value: str):
-        """Set a session value."""
+        """Set a session value in the per-request cache.
+
+        The write is persisted once by ``save()`` when the response goes out,
+        instead of rewriting the file on every mutation.
+        """
         self.modified = True
         self._session_cache[key] = value
-        self._save_session_data()
 
     def get_session(self, key: str) -> Optional[str]:
         """Get a session value."""
@@ -51,15 +63,19 @@ class FileSessionManager(BaseSessionInterface):
 
     def values(self):
         """Get all session values."""
+        return self._session_cache.values()
+
+    def items(self):
+        """Get all session items."""
         return self._session_cache.items()
 
     def is_empty(self) -> bool:
         """Check if the session is empty."""
-        return len(self._session_cache.items()) == 0
+        return not self._session_cache
 
     async def save(self):
-        """Save the session data to the file."""
-        self._save_session_data()
+        """Save the session data to the file without blocking the event loop."""
+        await run_in_threadpool(self._save_session_data)
 
     
 
@@ -78,17 +94,21 @@ class FileSessionManager(BaseSessionInterface):
         return False
 
     async def load(self):
-        """Load the session data from the file."""
-        session_data = self._load_session_data()
+        """Load the session data from the file, reading it at most once per request."""
+        if self._loaded:
+            return
+        session_data = await run_in_threadpool(self._load_session_data)
 
         if session_data:
             self._session_cache.update(session_data)
         else:
             self._session_cache = {}
+        self._loaded = True
 
     def clear(self):
         """Clear the session data."""
         self._session_cache.clear()
+        self._loaded = True
         if os.path.exists(self.session_file_path):
             os.remove(self.session_file_path)
 
@@ -1,26 +1,34 @@
 from nexios.middlewares.base import BaseMiddleware
+from .base import SessionManagerPool
 from .signed_cookies import SignedSessionManager
 from .file import FileSessionManager
 from .db import DBSessionManager
 from nexios.http.request import Request
 from nexios.http.response import NexioResponse
+
+_manager_pool = SessionManagerPool()
+
+# Single source of truth for backend selection, built once at import time
+# instead of per request.
+_SESSION_MANAGERS = {
+    "file": FileSessionManager,
+    "db": DBSessionManager,
+    "cookies": SignedSessionManager,
+}
+
+
 class SessionMiddleware(BaseMiddleware):
 
     async def process_request(self, request :Request, response):
-    
+
         self.config = request.scope['config']
         session_cookie_name = self.config.SESSION_COOKIE_NAME or "session_id"
-        managers = {
-            "file":FileSessionManager,
-            "db":DBSessionManager,
-            "cookies":SessionMiddleware
-        }    
-        manager_config = self.config.SESSION_MANAGER 
-        manager = managers.get(manager_config,SignedSessionManager)
-        session = manager(
+        manager_config = self.config.SESSION_MANAGER
+        manager = _SESSION_MANAGERS.get(manager_config,SignedSessionManager)
+        session = _manager_pool.acquire(
+            manager,
+            session_key=request.cookies.get(session_cookie_name),
             config=self.config,
-            session_key=request.cookies.get(session_cookie_name)
-
         )
 
         await session.load()
@@ -31,9 +39,14 @@ class SessionMiddleware(BaseMiddleware):
         if request.session.is_empty() and request.session.accessed:
             response.delete_cookie(
                 key=self.config.SESSION_COOKIE_NAME or "session_id",
-                
+
                 )
-            return 
+            # Detach before releasing so late request.session access fails
+            # loudly instead of reading a recycled manager.
+            session = request.scope.pop('session', None)
+            if session is not None:
+                _manager_pool.release(session)
+            return
         if request.session.should_set_cookie:
             await request.session.save()
 
@@ -48,6 +61,11 @@ class SessionMiddleware(BaseMiddleware):
                 secure=request.session.get_cookie_secure(),
                 samesite=request.session.get_cookie_samesite(),
                 expires=request.session.get_expiration_time()
-                
+
             )
+        # Detach before releasing so late request.session access fails
+        # loudly instead of reading a recycled manager.
+        session = request.scope.pop('session', None)
+        if session is not None:
+            _manager_pool.release(session)
 
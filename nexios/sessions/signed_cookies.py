@@ -1,17 +1,78 @@
-from itsdangerous import URLSafeTimedSerializer, BadSignature
+from itsdangerous import URLSafeTimedSerializer, TimestampSigner, BadSignature
 import typing
 from nexios.config.settings import BaseConfig
 from .base import BaseSessionInterface
 
 
+class _CachedKeySigner(TimestampSigner):
+    """TimestampSigner that derives its HMAC key once.
+
+    ``sign``/``verify`` call ``derive_key`` on every invocation, re-running
+    the key derivation per request even though the secret key and salt never
+    change. The derived key for the default secret is cached; explicit keys
+    (used for secret rotation) still derive normally.
+    """
+
+    _cached_key: typing.Optional[bytes] = None
+
+    def derive_key(self, secret_key=None) -> bytes:
+        if secret_key is not None:
+            return super().derive_key(secret_key)
+        if self._cached_key is None:
+            self._cached_key = super().derive_key()
+        return self._cached_key
+
+
+class _CachedSignerSerializer(URLSafeTimedSerializer):
+    """URLSafeTimedSerializer that builds its signer once per salt.
+
+    ``dumps``/``loads`` construct a fresh signer on every call; with a fixed
+    salt the signer is immutable, so it is created a single time and reused.
+    """
+
+    _signer_cache: typing.Optional[dict] = None
+
+    def make_signer(self, salt=None):
+        if self._signer_cache is None:
+            self._signer_cache = {}
+        signer = self._signer_cache.get(salt)
+        if signer is None:
+            signer = self._signer_cache[salt] = super().make_signer(salt)
+        return signer
+
+
+_SERIALIZER_CACHE: typing.Dict[int, URLSafeTimedSerializer] = {}
+
+
+def _get_serializer(config: BaseConfig) -> URLSafeTimedSerializer:
+    """Returns the signing serializer for a config, building it only once.
+
+    The secret key never changes for a running app, so re-deriving the
+    signing key on every request is wasted work on the hot path.
+    """
+    serializer = _SERIALIZER_CACHE.get(id(config))
+    if serializer is None:
+        serializer = _SERIALIZER_CACHE.setdefault(
+            id(config),
+            _CachedSignerSerializer(secret_key=config.SECRET_KEY,
+                                    salt="nexio.session.signed_cookie",
+                                    signer=_CachedKeySigner),
+        )
+    return serializer
+
+
 class SignedSessionManager(BaseSessionInterface):
     def __init__(self, session_key: str, config: BaseConfig = BaseConfig):
         super().__init__(session_key, config)
         self.secret_key = config.secret_key
-        self.serializer = URLSafeTimedSerializer(secret_key=config.SECRET_KEY,
-                                                 salt="nexio.session.signed_cookie")
+        self.serializer = _get_serializer(config)
         session_key = session_key
 
+    def _reset(self, session_key: str, config: BaseConfig):
+        """Rebind a pooled instance to a new request."""
+        super()._reset(session_key, config)
+        self.serializer = _get_serializer(config)
+
     def sign_session_data(self, session_data: typing.Dict[str, typing.Any]) -> str:
         """
         Sign the session data and return a signed token (cookie value).
@@ -0,0 +1,12 @@
+import secrets
+
+
+def generate_session_key(nbytes: int = 32) -> str:
+    """
+    Returns a new URL-safe session key from the CSPRNG.
+
+    The keyspace is large enough (256 bits by default) that collisions are
+    astronomically unlikely, so callers should trust the generated key rather
+    than round-tripping to the backend to check for an existing one.
+    """
+    return secrets.token_urlsafe(nbytes)